@@ -0,0 +1,60 @@
+import contextlib
+import io
+import timeit
+
+from compiled_kernels import numba_available
+from main import equations
+from zero_finder import ZeroFinder
+
+# Intervals bracketing one root of each equation from main.py, chosen so that
+# all three methods converge on them
+intervals = {
+    1: (2.0, 3.0),
+    2: (1.0, 2.0),
+    3: (1.5, 2.5),
+    4: (0.5, 1.0),
+    5: (1.5, 2.5),
+}
+
+methods = ["bisection_method", "newton_method", "simple_iteration_method"]
+
+
+def time_method(zero_finder, method, repeat=200):
+    """
+    Return the mean time in microseconds to find one root, or None if the
+    method does not converge.
+    """
+    solve = getattr(zero_finder, method)
+    with contextlib.redirect_stdout(io.StringIO()):
+        # Warm-up, triggers JIT compilation
+        if not solve(tolerance=1e-10).converged:
+            return None
+        seconds = timeit.timeit(lambda: solve(tolerance=1e-10), number=repeat)
+    return seconds / repeat * 1e6
+
+
+if __name__ == "__main__":
+    if not numba_available():
+        print("numba is not installed, only the Python backend will be timed")
+
+    print(
+        f"{'equation':<36}{'method':<26}"
+        f"{'python, us':>12}{'numba, us':>12}{'speedup':>10}"
+    )
+    for eq in equations:
+        interval = intervals[eq["id"]]
+        python_finder = ZeroFinder(eq["f"], eq["df"], interval)
+        numba_finder = ZeroFinder(eq["f"], eq["df"], interval, backend="numba")
+
+        for method in methods:
+            python_time = time_method(python_finder, method)
+            numba_time = time_method(numba_finder, method)
+            if python_time is None or numba_time is None:
+                backend = "python" if python_time is None else "numba"
+                print(f"{eq['name']:<36}{method:<26}no convergence ({backend})")
+                continue
+            speedup = python_time / numba_time
+            print(
+                f"{eq['name']:<36}{method:<26}"
+                f"{python_time:>12.2f}{numba_time:>12.2f}{speedup:>9.1f}x"
+            )
@@ -0,0 +1,262 @@
+import functools
+import math
+
+import numpy as np
+
+# numba is imported on first use (see _load_numba), so that importing the
+# solvers stays cheap with the default Python backend
+numba = None
+NumbaError = ()
+_numba_loaded = False
+
+from solver_result import (
+    CONVERGED,
+    DEFAULT_PATIENCE,
+    DEFAULT_STAGNATION_WINDOW,
+    DIVERGED,
+    MAX_ITERATIONS,
+    NON_FINITE,
+    OSCILLATING,
+    STAGNATED,
+    ZERO_DERIVATIVE,
+)
+
+STATUS_RUNNING = -1
+STATUS_CONVERGED = 0
+STATUS_MAX_ITERATIONS = 1
+STATUS_ZERO_DERIVATIVE = 2
+STATUS_NON_FINITE = 3
+STATUS_DIVERGED = 4
+STATUS_OSCILLATING = 5
+STATUS_STAGNATED = 6
+
+KERNEL_REASONS = {
+    STATUS_CONVERGED: CONVERGED,
+    STATUS_MAX_ITERATIONS: MAX_ITERATIONS,
+    STATUS_ZERO_DERIVATIVE: ZERO_DERIVATIVE,
+    STATUS_NON_FINITE: NON_FINITE,
+    STATUS_DIVERGED: DIVERGED,
+    STATUS_OSCILLATING: OSCILLATING,
+    STATUS_STAGNATED: STAGNATED,
+}
+
+# Number of (f, f') pairs whose compiled kernels are kept
+KERNEL_CACHE_SIZE = 32
+
+
+def _load_numba():
+    """
+    Import numba and compile the shared kernel helpers once.
+    Returns False when numba is not installed.
+    """
+    global numba, NumbaError, _numba_loaded, _new_monitor_state, _check_step
+    if not _numba_loaded:
+        _numba_loaded = True
+        try:
+            import numba as numba_module
+            from numba.core.errors import NumbaError as numba_error
+        except ImportError:
+            return False
+        numba, NumbaError = numba_module, numba_error
+        _new_monitor_state = numba.njit(_new_monitor_state)
+        _check_step = numba.njit(_check_step)
+    return numba is not None
+
+
+def numba_available():
+    return _load_numba()
+
+
+def make_callable(func):
+    """
+    Turn a user function into a plain Python callable.
+
+    Parameters:
+    - func: Callable, or expression string in the variable x
+      (e.g. "x**3 - 2*x + math.sin(x)", math functions are available)
+
+    Returns:
+    - Python callable of one float argument (None is passed through)
+    """
+    if func is None or callable(func):
+        return func
+    return eval("lambda x: " + func, {"math": math, **vars(math)})
+
+
+@functools.lru_cache(maxsize=KERNEL_CACHE_SIZE)
+def compile_function(func):
+    """
+    JIT-compile a user function with numba. Results are cached on the
+    callable or expression string itself, so it is compiled only once.
+
+    Returns None when numba is missing or the function cannot be compiled,
+    so that callers can fall back to the Python implementation.
+    """
+    if func is None or not _load_numba():
+        return None
+    if isinstance(func, numba.core.dispatcher.Dispatcher):
+        return func
+    try:
+        return numba.njit("float64(float64)")(make_callable(func))
+    except (NumbaError, TypeError):
+        return None
+
+
+def _new_monitor_state():
+    # last_step, last_residual, growing, oscillating, best_residual, since_best
+    return np.array([np.inf, np.inf, 0.0, 0.0, np.inf, 0.0])
+
+
+def _check_step(state, x_before, x, x_new, residual, tolerance, rtol, ftol):
+    """
+    Scalar mirror of solver_result.ConvergenceMonitor.check for the kernels.
+    x_before is NaN on the first iteration.
+    """
+    step = abs(x_new - x)
+    if not (np.isfinite(step) and np.isfinite(residual)):
+        return STATUS_NON_FINITE
+    if step < tolerance + rtol * abs(x_new) and residual < ftol:
+        return STATUS_CONVERGED
+
+    if step > state[0] and residual > state[1]:
+        state[2] += 1
+    else:
+        state[2] = 0
+    if abs(x_new - x_before) < 0.1 * step and step > 0.99 * state[0]:
+        state[3] += 1
+    else:
+        state[3] = 0
+    if residual < state[4]:
+        state[4] = residual
+        state[5] = 0
+    else:
+        state[5] += 1
+    state[0] = step
+    state[1] = residual
+
+    if state[2] >= DEFAULT_PATIENCE:
+        return STATUS_DIVERGED
+    if state[3] >= DEFAULT_PATIENCE:
+        return STATUS_OSCILLATING
+    if state[5] >= DEFAULT_STAGNATION_WINDOW:
+        return STATUS_STAGNATED
+    return STATUS_RUNNING
+
+
+def _build_kernels(f, df):
+    """
+    Build solver loops specialised to the compiled f and df.
+
+    f and df are closed over instead of being passed as arguments, which
+    would make numba dispatch on a function type on every call. The trace
+    is only allocated in full when record is set; otherwise a single
+    scratch row is reused.
+    """
+
+    def bisection(a, b, tolerance, rtol, max_iterations, record):
+        trace = np.empty((max_iterations if record else 1, 4))
+        fa = f(a)
+        for i in range(max_iterations):
+            c = (a + b) / 2
+            fc = f(c)
+            row = i if record else 0
+            trace[row, 0] = a
+            trace[row, 1] = b
+            trace[row, 2] = c
+            trace[row, 3] = fc
+
+            if not np.isfinite(fc):
+                return c, STATUS_NON_FINITE, i + 1, trace[: row + 1]
+            if abs(fc) < tolerance and (b - a) / 2 < tolerance + rtol * abs(c):
+                return c, STATUS_CONVERGED, i + 1, trace[: row + 1]
+
+            if fa * fc < 0:
+                b = c
+            else:
+                a, fa = c, fc
+
+        return (a + b) / 2, STATUS_MAX_ITERATIONS, max_iterations, trace
+
+    def newton(x, tolerance, rtol, max_iterations, record):
+        trace = np.empty((max_iterations if record else 1, 4))
+        state = _new_monitor_state()
+        x_before = np.nan
+        for i in range(max_iterations):
+            fx = f(x)
+            dfx = df(x)
+            row = i if record else 0
+            if dfx == 0:
+                return x, STATUS_ZERO_DERIVATIVE, i + 1, trace[:row]
+            x_new = x - fx / dfx
+            trace[row, 0] = x
+            trace[row, 1] = fx
+            trace[row, 2] = dfx
+            trace[row, 3] = x_new
+
+            status = _check_step(
+                state, x_before, x, x_new, abs(fx), tolerance, rtol, np.inf
+            )
+            if status != STATUS_RUNNING:
+                return x_new, status, i + 1, trace[: row + 1]
+            x_before = x
+            x = x_new
+
+        return x, STATUS_MAX_ITERATIONS, max_iterations, trace
+
+    def simple_iteration(lam, x_prev, tolerance, rtol, max_iterations, record):
+        trace = np.empty((max_iterations if record else 1, 4))
+        state = _new_monitor_state()
+        x_before = np.nan
+        for i in range(max_iterations):
+            x_next = x_prev + lam * f(x_prev)
+            f_x_next = f(x_next)
+            error = abs(x_next - x_prev)
+            row = i if record else 0
+            trace[row, 0] = x_prev
+            trace[row, 1] = x_next
+            trace[row, 2] = f_x_next
+            trace[row, 3] = error
+
+            status = _check_step(
+                state, x_before, x_prev, x_next, abs(f_x_next), tolerance, rtol, tolerance
+            )
+            if status != STATUS_RUNNING:
+                return x_next, status, i + 1, trace[: row + 1]
+            x_before = x_prev
+            x_prev = x_next
+
+        return x_prev, STATUS_MAX_ITERATIONS, max_iterations, trace
+
+    return (
+        numba.njit(bisection),
+        numba.njit(newton) if df is not None else None,
+        numba.njit(simple_iteration),
+    )
+
+
+@functools.lru_cache(maxsize=KERNEL_CACHE_SIZE)
+def get_kernels(func, derivative):
+    """
+    Return (bisection, newton, simple_iteration) kernels specialised to
+    func and derivative, or None when func cannot be compiled. newton is
+    None without a compiled derivative.
+
+    func and derivative are the user's callables or expression strings:
+    finders built from the same ones share a single compilation, and only
+    the KERNEL_CACHE_SIZE most recently used pairs are kept.
+    """
+    f = compile_function(func)
+    if f is None:
+        return None
+    return _build_kernels(f, compile_function(derivative))
+
+
+def run_kernel(kernel, *args):
+    """
+    Call a compiled kernel, returning None if numba fails to type it.
+    """
+    try:
+        root, status, iterations, trace = kernel(*args)
+    except NumbaError:
+        return None
+    return float(root), KERNEL_REASONS[status], iterations, trace
@@ -0,0 +1,154 @@
+import math
+
+import numpy as np
+
+# Complex step: no subtractive cancellation, so h can be tiny
+COMPLEX_STEP = 1e-20
+# First central difference step relative to max(1, |x|); it is halved
+# until the extrapolated estimate is accurate enough
+INITIAL_STEP = 1e-3
+# Most central differences (halvings of the step) per derivative
+MAX_LEVELS = 6
+# Relative error estimate at which the extrapolation stops
+EXTRAPOLATION_TOLERANCE = 1e-10
+# Relative difference allowed between complex step and central difference
+# when checking that f is analytic
+AGREEMENT_TOLERANCE = 1e-6
+# The complex step is checked on the first CHECKED_CALLS calls and then on
+# every CHECK_INTERVAL-th call
+CHECKED_CALLS = 3
+CHECK_INTERVAL = 10
+
+
+def _norm(value):
+    return float(np.max(np.abs(value)))
+
+
+def _needs_check(calls):
+    return calls <= CHECKED_CALLS or calls % CHECK_INTERVAL == 0
+
+
+def extrapolated_difference(difference, h):
+    """
+    Ridders' method: central differences difference(h), difference(h / 2),
+    ... are extrapolated to h -> 0 with a Richardson tableau, which picks
+    the step adaptively. Stops when the error estimate falls below
+    EXTRAPOLATION_TOLERANCE relative to the result, or when it starts to grow
+    because round-off dominates. Works for scalar and array differences.
+
+    Returns:
+    - (derivative, error estimate)
+    """
+    previous = [difference(h)]
+    best, error = previous[0], math.inf
+    for level in range(1, MAX_LEVELS):
+        h /= 2
+        row = [difference(h)]
+        factor = 4.0
+        for j in range(1, level + 1):
+            row.append((factor * row[j - 1] - previous[j - 1]) / (factor - 1))
+            factor *= 4
+            estimate = max(_norm(row[j] - row[j - 1]), _norm(row[j] - previous[j - 1]))
+            if estimate <= error:
+                best, error = row[j], estimate
+        if _norm(row[level] - previous[level - 1]) >= 2 * error:
+            break
+        if error <= EXTRAPOLATION_TOLERANCE * max(1.0, _norm(best)):
+            break
+        previous = row
+    return best, error
+
+
+class NumericalDerivative:
+    """
+    Derivative of a scalar function, used when no derivative is supplied.
+
+    Uses the complex step f'(x) = Im f(x + ih) / h, accurate to machine
+    precision with a single call, if f accepts complex arguments (e.g.
+    polynomials, cmath/numpy functions). The complex step is only valid for
+    analytic f, so it is checked against a central difference on the first
+    calls and periodically afterwards, and dropped for good on the first
+    disagreement (e.g. x * abs(x)). Otherwise central differences with an
+    adaptive step are used (see extrapolated_difference).
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.use_complex = None
+        self.calls = 0
+
+    def __call__(self, x):
+        self.calls += 1
+        if self.use_complex is not False:
+            try:
+                value = self.func(x + 1j * COMPLEX_STEP)
+            except (TypeError, ValueError):
+                value = None
+            if not isinstance(value, complex):
+                self.use_complex = False
+            else:
+                derivative = value.imag / COMPLEX_STEP
+                if not _needs_check(self.calls):
+                    return derivative
+                central = self._central(x)
+                self.use_complex = abs(derivative - central) <= (
+                    AGREEMENT_TOLERANCE * max(1.0, abs(central))
+                )
+                return derivative if self.use_complex else central
+
+        return self._central(x)
+
+    def _central(self, x):
+        difference = lambda h: (self.func(x + h) - self.func(x - h)) / (2 * h)
+        return extrapolated_difference(difference, INITIAL_STEP * max(1.0, abs(x)))[0]
+
+
+class NumericalJacobian:
+    """
+    Jacobian of a vector function, used when no Jacobian is supplied.
+
+    Same strategy as NumericalDerivative, column by column: n calls of F
+    with complex steps, checked the same way, or adaptive central
+    differences.
+    """
+
+    def __init__(self, F):
+        self.F = F
+        self.use_complex = None
+        self.calls = 0
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=float)
+        n = len(x)
+        self.calls += 1
+
+        if self.use_complex is not False:
+            try:
+                columns = [self.F(x + 1j * COMPLEX_STEP * e) for e in np.eye(n)]
+                is_complex = np.iscomplexobj(columns[0])
+            except (TypeError, ValueError):
+                is_complex = False
+            if not is_complex:
+                self.use_complex = False
+            else:
+                jacobian = np.column_stack([np.imag(c) for c in columns]) / COMPLEX_STEP
+                if not _needs_check(self.calls):
+                    return jacobian
+                central = self._central(x)
+                self.use_complex = _norm(jacobian - central) <= (
+                    AGREEMENT_TOLERANCE * max(1.0, _norm(central))
+                )
+                return jacobian if self.use_complex else central
+
+        return self._central(x)
+
+    def _central(self, x):
+        scale = np.maximum(1.0, np.abs(x))
+        columns = []
+        for j in range(len(x)):
+            e = np.zeros(len(x))
+            e[j] = scale[j]
+            difference = lambda h: (self.F(x + h * e) - self.F(x - h * e)) / (2 * h)
+            column, _ = extrapolated_difference(difference, INITIAL_STEP)
+            columns.append(column / scale[j])
+        return np.column_stack(columns)
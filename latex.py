@@ -80,6 +80,85 @@ def generate_simple_iter_latex_table(zero_finder: ZeroFinder):
     return "\n".join(latex)
 
 
+def _higher_order_latex_table(data):
+    if not data:
+        return ""
+
+    headers = ["Iteration", "$x_n$", "$f(x_n)$", "$f'(x_n)$", "$f''(x_n)$", "$x_{n+1}$"]
+    latex = [
+        r"\begin{tabular}{|c|c|c|c|c|c|}",
+        r"\hline",
+        " & ".join(headers) + r" \\",
+        r"\hline",
+    ]
+
+    for i, entry in enumerate(data):
+        # Steps replaced by bisection are marked with an asterisk
+        row = [
+            str(i + 1) + ("*" if entry["bisected"] else ""),
+            f"{entry['x']:.6f}",
+            f"{entry['fx']:.6f}",
+            f"{entry['dfx']:.6f}",
+            f"{entry['d2fx']:.6f}",
+            f"{entry['x_new']:.6f}",
+        ]
+        latex.append(" & ".join(row) + r" \\")
+        latex.append(r"\hline")
+
+    latex.append(r"\end{tabular}")
+    return "\n".join(latex)
+
+
+def generate_halley_latex_table(zero_finder: ZeroFinder):
+    return _higher_order_latex_table(zero_finder.halley_data)
+
+
+def generate_chebyshev_latex_table(zero_finder: ZeroFinder):
+    return _higher_order_latex_table(zero_finder.chebyshev_data)
+
+
+def generate_householder_latex_table(zero_finder: ZeroFinder):
+    return _higher_order_latex_table(zero_finder.householder_data)
+
+
+def _derivative_free_latex_table(data):
+    if not data:
+        return ""
+
+    headers = ["Iteration", "$x_n$", "$f(x_n)$", "$x_{n+1}$"]
+    latex = [
+        r"\begin{tabular}{|c|c|c|c|}",
+        r"\hline",
+        " & ".join(headers) + r" \\",
+        r"\hline",
+    ]
+
+    for i, entry in enumerate(data):
+        row = [
+            str(i + 1),
+            f"{entry['x']:.6f}",
+            f"{entry['fx']:.6f}",
+            f"{entry['x_new']:.6f}",
+        ]
+        latex.append(" & ".join(row) + r" \\")
+        latex.append(r"\hline")
+
+    latex.append(r"\end{tabular}")
+    return "\n".join(latex)
+
+
+def generate_secant_latex_table(zero_finder: ZeroFinder):
+    return _derivative_free_latex_table(zero_finder.secant_data)
+
+
+def generate_steffensen_latex_table(zero_finder: ZeroFinder):
+    return _derivative_free_latex_table(zero_finder.steffensen_data)
+
+
+def generate_inverse_quadratic_latex_table(zero_finder: ZeroFinder):
+    return _derivative_free_latex_table(zero_finder.inverse_quadratic_data)
+
+
 def generate_newton_system_latex_table(solver):
     """
     Generate a LaTeX table for Newton's method iterations.
@@ -1,44 +1,65 @@
 import math
 from latex import (
     generate_bisection_latex_table,
+    generate_chebyshev_latex_table,
+    generate_halley_latex_table,
     generate_newton_latex_table,
+    generate_secant_latex_table,
     generate_simple_iter_latex_table,
 )
-from plotter import plot_bisection, plot_graph, plot_newton, plot_simple_iteration
+from plotter import (
+    plot_bisection,
+    plot_chebyshev,
+    plot_graph,
+    plot_halley,
+    plot_newton,
+    plot_secant,
+    plot_simple_iteration,
+)
+from polynomial_solver import PolynomialSolver, real_roots
 from zero_finder import ZeroFinder
 
 
-# Predefined equations with f, df, and d2f
+# Predefined equations with f, df, d2f and polynomial coefficients if any
 equations = [
     {
         "id": 1,
         "name": "-2.4x³ + 1.27x² + 8.36x + 2.31",
         "f": lambda x: -2.4 * x**3 + 1.27 * x**2 + 8.36 * x + 2.31,
         "df": lambda x: -7.2 * x**2 + 2.54 * x + 8.36,
+        "d2f": lambda x: -14.4 * x + 2.54,
+        "coeffs": [-2.4, 1.27, 8.36, 2.31],
     },
     {
         "id": 2,
         "name": "5.74x³ - 2.95x² - 10.28x - 3.23",
         "f": lambda x: 5.74 * x**3 - 2.95 * x**2 - 10.28 * x - 3.23,
         "df": lambda x: 17.22 * x**2 - 5.9 * x - 10.28,
+        "d2f": lambda x: 34.44 * x - 5.9,
+        "coeffs": [5.74, -2.95, -10.28, -3.23],
     },
     {
         "id": 3,
         "name": "x³ + 2.64x² - 5.41x - 11.76",
         "f": lambda x: x**3 + 2.64 * x**2 - 5.41 * x - 11.76,
         "df": lambda x: 3 * x**2 + 5.28 * x - 5.41,
+        "d2f": lambda x: 6 * x + 5.28,
+        "coeffs": [1, 2.64, -5.41, -11.76],
     },
     {
         "id": 4,
         "name": "sin(x) - e^(-x)",
         "f": lambda x: math.sin(x) - math.exp(-x),
         "df": lambda x: math.cos(x) + math.exp(-x),
+        "d2f": lambda x: -math.sin(x) - math.exp(-x),
     },
     {
         "id": 5,
         "name": "x³ + 2.84x² - 5.606x - 14.766",
         "f": lambda x: x**3 + 2.84 * x**2 - 5.606 * x - 14.766,
         "df": lambda x: 3 * x**2 + 5.68 * x - 5.606,
+        "d2f": lambda x: 6 * x + 5.68,
+        "coeffs": [1, 2.84, -5.606, -14.766],
     },
 ]
 
@@ -54,7 +75,7 @@ def select_function():
             for eq in equations:
                 if eq["id"] == choice:
                     print(f"Selected function: {eq['name']}")
-                    return eq["f"], eq["df"], eq["name"]
+                    return eq["f"], eq["df"], eq["d2f"], eq.get("coeffs"), eq["name"]
             print("Invalid ID. Please enter a number between 1 and 5.")
         except ValueError:
             print("Invalid input. Please enter a number.")
@@ -86,18 +107,18 @@ def get_epsilon():
 
 
 if __name__ == "__main__":
-    f, df, name = select_function()
+    f, df, d2f, coeffs, name = select_function()
     interval = get_interval()
     epsilon = get_epsilon()
-    zero_finder = ZeroFinder(f, df, interval, "output/")
+    zero_finder = ZeroFinder(f, df, interval, "output/", second_derivative=d2f)
     plot_graph(zero_finder, "output/graph_plot.png")
 
     try:
         print("\nRunning Bisection method:")
-        root = zero_finder.bisection_method(tolerance=epsilon, debug=True)
-        print(f"Bisection root: {root:.6f}")
-        print(f"Bisection value: {f(root)}")
-        print(f"Bisection iterations: {len(zero_finder.bisection_data)}")
+        result = zero_finder.bisection_method(tolerance=epsilon, debug=True)
+        print(f"Bisection root: {result.root:.6f} ({result.reason})")
+        print(f"Bisection value: {f(result.root)}")
+        print(f"Bisection iterations: {result.iterations}")
 
         latex_str = generate_bisection_latex_table(zero_finder)
         with open("output/bisection.tex", "w") as file:
@@ -111,10 +132,10 @@ if __name__ == "__main__":
 
     try:
         print("\nRunning Newton method:")
-        root = zero_finder.newton_method(tolerance=epsilon, debug=True)
-        print(f"Newton root: {root:.6f}")
-        print(f"Newton value: {f(root)}")
-        print(f"Newton iterations: {len(zero_finder.newton_data)}")
+        result = zero_finder.newton_method(tolerance=epsilon, debug=True)
+        print(f"Newton root: {result.root:.6f} ({result.reason})")
+        print(f"Newton value: {f(result.root)}")
+        print(f"Newton iterations: {result.iterations}")
 
         latex_str = generate_newton_latex_table(zero_finder)
         with open("output/newton.tex", "w") as file:
@@ -126,12 +147,63 @@ if __name__ == "__main__":
     except OverflowError as e:
         print(f"Newton error: {e}")
 
+    try:
+        print("\nRunning Halley method:")
+        result = zero_finder.halley_method(tolerance=epsilon, debug=True)
+        print(f"Halley root: {result.root:.6f} ({result.reason})")
+        print(f"Halley value: {f(result.root)}")
+        print(f"Halley iterations: {result.iterations}")
+
+        latex_str = generate_halley_latex_table(zero_finder)
+        with open("output/halley.tex", "w") as file:
+            file.write(latex_str)
+        plot_halley(zero_finder)
+
+    except ValueError as e:
+        print(f"Halley error: {e}")
+    except OverflowError as e:
+        print(f"Halley error: {e}")
+
+    try:
+        print("\nRunning Chebyshev method:")
+        result = zero_finder.chebyshev_method(tolerance=epsilon, debug=True)
+        print(f"Chebyshev root: {result.root:.6f} ({result.reason})")
+        print(f"Chebyshev value: {f(result.root)}")
+        print(f"Chebyshev iterations: {result.iterations}")
+
+        latex_str = generate_chebyshev_latex_table(zero_finder)
+        with open("output/chebyshev.tex", "w") as file:
+            file.write(latex_str)
+        plot_chebyshev(zero_finder)
+
+    except ValueError as e:
+        print(f"Chebyshev error: {e}")
+    except OverflowError as e:
+        print(f"Chebyshev error: {e}")
+
+    try:
+        print("\nRunning Secant method:")
+        result = zero_finder.secant_method(tolerance=epsilon, debug=True)
+        print(f"Secant root: {result.root:.6f} ({result.reason})")
+        print(f"Secant value: {f(result.root)}")
+        print(f"Secant iterations: {result.iterations}")
+
+        latex_str = generate_secant_latex_table(zero_finder)
+        with open("output/secant.tex", "w") as file:
+            file.write(latex_str)
+        plot_secant(zero_finder)
+
+    except ValueError as e:
+        print(f"Secant error: {e}")
+    except OverflowError as e:
+        print(f"Secant error: {e}")
+
     try:
         print("\nRunning Iterative method:")
-        root = zero_finder.simple_iteration_method(tolerance=epsilon, debug=True)
-        print(f"Iterative root: {root:.6f}")
-        print(f"Iterative value: {f(root)}")
-        print(f"Iterative iterations: {len(zero_finder.simple_iter_data)}")
+        result = zero_finder.simple_iteration_method(tolerance=epsilon, debug=True)
+        print(f"Iterative root: {result.root:.6f} ({result.reason})")
+        print(f"Iterative value: {f(result.root)}")
+        print(f"Iterative iterations: {result.iterations}")
 
         latex_str = generate_simple_iter_latex_table(zero_finder)
         with open("output/simple_iteration.tex", "w") as file:
@@ -142,3 +214,18 @@ if __name__ == "__main__":
         print(f"Iterative error: {e}")
     except OverflowError as e:
         print(f"Iterative error: {e}")
+
+    try:
+        print("\nFinding all roots:")
+        if coeffs is not None:
+            result = PolynomialSolver(coeffs).aberth_method(tolerance=epsilon)
+            print(f"Aberth roots: {result.root} ({result.reason})")
+            print(f"Real roots: {real_roots(result.root, tolerance=epsilon)}")
+            print(f"Evaluations: {result.func_evals} f, {result.derivative_evals} f'")
+        else:
+            print("Only available for polynomial equations")
+
+    except ValueError as e:
+        print(f"All roots error: {e}")
+    except OverflowError as e:
+        print(f"All roots error: {e}")
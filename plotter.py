@@ -145,6 +145,107 @@ def plot_simple_iteration(zero_finder: ZeroFinder):
     plt.close()
 
 
+def _plot_steps(zero_finder: ZeroFinder, data, title, file_name):
+    x_vals = np.linspace(zero_finder.a, zero_finder.b, 1000)
+    f_vals = [zero_finder.func(x) for x in x_vals]
+
+    fig, ax = plt.subplots(figsize=(12, 7))
+    ax.plot(x_vals, f_vals, label="f(x)", color="blue")
+    ax.axhline(0, color="black", linestyle="--", alpha=0.5)
+
+    colors = plt.cm.plasma(np.linspace(0, 1, len(data)))
+    for i, (entry, color) in enumerate(zip(data, colors)):
+        ax.scatter(entry["x"], entry["fx"], color=color, s=80, zorder=3)
+        # Bisection fallback steps are drawn dotted
+        ax.plot(
+            [entry["x"], entry["x_new"]],
+            [entry["fx"], 0],
+            linestyle=":" if entry.get("bisected") else "--",
+            color=color,
+            alpha=0.7,
+            label=f"Iter {i+1}" if i == 0 else "",
+        )
+
+    final_x = data[-1]["x_new"]
+    ax.scatter(final_x, 0, color="red", marker="*", s=200, zorder=4, label="Root")
+
+    ax.set_title(title)
+    ax.legend()
+    ax.grid(True)
+
+    plt.tight_layout()
+    if zero_finder.plot_path:
+        plt.savefig(zero_finder.plot_path + file_name + ".pdf", bbox_inches="tight")
+        plt.savefig(zero_finder.plot_path + file_name + ".png", bbox_inches="tight")
+    plt.close()
+
+
+def plot_halley(zero_finder: ZeroFinder):
+    if not zero_finder.halley_data:
+        print("Run halley_method with debug=True first")
+        return
+    _plot_steps(
+        zero_finder, zero_finder.halley_data, "Halley Method Convergence", "halley"
+    )
+
+
+def plot_chebyshev(zero_finder: ZeroFinder):
+    if not zero_finder.chebyshev_data:
+        print("Run chebyshev_method with debug=True first")
+        return
+    _plot_steps(
+        zero_finder,
+        zero_finder.chebyshev_data,
+        "Chebyshev Method Convergence",
+        "chebyshev",
+    )
+
+
+def plot_householder(zero_finder: ZeroFinder):
+    if not zero_finder.householder_data:
+        print("Run householder_method with debug=True first")
+        return
+    _plot_steps(
+        zero_finder,
+        zero_finder.householder_data,
+        "Householder Method Convergence",
+        "householder",
+    )
+
+
+def plot_secant(zero_finder: ZeroFinder):
+    if not zero_finder.secant_data:
+        print("Run secant_method with debug=True first")
+        return
+    _plot_steps(
+        zero_finder, zero_finder.secant_data, "Secant Method Convergence", "secant"
+    )
+
+
+def plot_steffensen(zero_finder: ZeroFinder):
+    if not zero_finder.steffensen_data:
+        print("Run steffensen_method with debug=True first")
+        return
+    _plot_steps(
+        zero_finder,
+        zero_finder.steffensen_data,
+        "Steffensen Method Convergence",
+        "steffensen",
+    )
+
+
+def plot_inverse_quadratic(zero_finder: ZeroFinder):
+    if not zero_finder.inverse_quadratic_data:
+        print("Run inverse_quadratic_method with debug=True first")
+        return
+    _plot_steps(
+        zero_finder,
+        zero_finder.inverse_quadratic_data,
+        "Inverse Quadratic Interpolation Convergence",
+        "inverse_quadratic",
+    )
+
+
 def plot_newton_system(solver):
     """
     Plot the convergence behavior of Newton's method for systems.
@@ -0,0 +1,173 @@
+import time
+
+import numpy as np
+
+from solver_result import (
+    CONVERGED,
+    MAX_ITERATIONS,
+    ConvergenceMonitor,
+    SolverResult,
+)
+
+
+class PolynomialSolver:
+    def __init__(self, coefficients):
+        """
+        Initialize the solver for all roots of a polynomial.
+
+        Parameters:
+        - coefficients: Polynomial coefficients, highest degree first
+          (np.polyval order), e.g. [1, 2.64, -5.41, -11.76]
+        """
+        coefficients = np.asarray(coefficients, dtype=complex)
+        self.coefficients = np.trim_zeros(coefficients, "f")
+        if len(self.coefficients) < 2:
+            raise ValueError("Polynomial must have degree at least 1")
+        self.degree = len(self.coefficients) - 1
+        self.derivative_coefficients = np.polyder(self.coefficients)
+        self.iterations = []
+
+    def initial_guesses(self):
+        """
+        Points spread on a circle of the Cauchy bound radius, which contains
+        every root. The angular offset avoids symmetric starting sets.
+        """
+        a = self.coefficients
+        radius = 1 + np.max(np.abs(a[1:] / a[0]))
+        k = np.arange(self.degree)
+        return radius * np.exp(1j * (2 * np.pi * k / self.degree + 0.4))
+
+    def aberth_method(
+        self,
+        initial_guess=None,
+        tolerance=1e-6,
+        max_iterations=100,
+        debug=False,
+        rtol=0.0,
+    ):
+        """
+        Aberth-Ehrlich iteration, cubically convergent for simple roots:
+        z_k -= w_k / (1 - w_k * sum_{j != k} 1 / (z_k - z_j)),
+        w_k = p(z_k) / p'(z_k)
+        """
+
+        def step(z, pz):
+            w = pz / np.polyval(self.derivative_coefficients, z)
+            return w / (1 - w * self._reciprocal_sums(z))
+
+        return self._simultaneous_iteration(
+            step, True, initial_guess, tolerance, max_iterations, debug, rtol
+        )
+
+    def durand_kerner_method(
+        self,
+        initial_guess=None,
+        tolerance=1e-6,
+        max_iterations=500,
+        debug=False,
+        rtol=0.0,
+    ):
+        """
+        Durand-Kerner (Weierstrass) iteration, quadratically convergent and
+        derivative-free:
+        z_k -= p(z_k) / (a_n * prod_{j != k} (z_k - z_j))
+        """
+
+        def step(z, pz):
+            diff = z[:, None] - z[None, :]
+            np.fill_diagonal(diff, 1)
+            return pz / (self.coefficients[0] * np.prod(diff, axis=1))
+
+        return self._simultaneous_iteration(
+            step, False, initial_guess, tolerance, max_iterations, debug, rtol
+        )
+
+    @staticmethod
+    def _reciprocal_sums(z):
+        diff = z[:, None] - z[None, :]
+        np.fill_diagonal(diff, np.inf)
+        return np.sum(1 / diff, axis=1)
+
+    def _simultaneous_iteration(
+        self,
+        step,
+        uses_derivative,
+        initial_guess,
+        tolerance,
+        max_iterations,
+        debug,
+        rtol,
+    ):
+        """
+        Update all root estimates together until the largest correction is
+        below tolerance. Only NaN/Inf is treated as early failure: the
+        estimates legitimately wander while they separate.
+        """
+        start = time.perf_counter()
+        self.iterations = []
+        max_norm = lambda v: np.max(np.abs(v))
+        monitor = ConvergenceMonitor(
+            tolerance,
+            rtol,
+            norm=max_norm,
+            patience=max_iterations + 1,
+            stagnation_window=max_iterations + 1,
+        )
+
+        z = (
+            np.array(initial_guess, dtype=complex)
+            if initial_guess is not None
+            else self.initial_guesses()
+        )
+        pz = np.polyval(self.coefficients, z)
+        func_evals = self.degree
+        derivative_evals = 0
+        iterations = 0
+
+        for i in range(max_iterations):
+            iterations = i + 1
+            correction = step(z, pz)
+            if uses_derivative:
+                derivative_evals += self.degree
+            z_new = z - correction
+
+            if debug:
+                self.iterations.append(
+                    {
+                        "iteration": i + 1,
+                        "roots": z.copy(),
+                        "delta_norm": max_norm(correction),
+                        "f_norm": max_norm(pz),
+                    }
+                )
+
+            reason = monitor.check(z, z_new, max_norm(pz))
+            z = z_new
+            pz = np.polyval(self.coefficients, z)
+            func_evals += self.degree
+            if reason is not None:
+                break
+        else:
+            reason = MAX_ITERATIONS
+
+        residual = float(max_norm(pz))
+        if reason == CONVERGED:
+            z = z[np.lexsort((z.imag, z.real))]
+        return SolverResult(
+            root=z,
+            residual=residual,
+            iterations=iterations,
+            func_evals=func_evals,
+            derivative_evals=derivative_evals,
+            reason=reason,
+            elapsed=time.perf_counter() - start,
+        )
+
+
+def real_roots(roots, tolerance=1e-8):
+    """
+    Return the sorted real parts of the roots whose imaginary part is
+    negligible.
+    """
+    roots = np.asarray(roots)
+    return np.sort(roots[np.abs(roots.imag) < tolerance].real)
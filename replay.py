@@ -0,0 +1,127 @@
+import argparse
+import os
+
+from latex import (
+    generate_bisection_latex_table,
+    generate_chebyshev_latex_table,
+    generate_halley_latex_table,
+    generate_householder_latex_table,
+    generate_inverse_quadratic_latex_table,
+    generate_newton_latex_table,
+    generate_newton_system_latex_table,
+    generate_secant_latex_table,
+    generate_simple_iter_latex_table,
+    generate_steffensen_latex_table,
+)
+from plotter import (
+    plot_bisection,
+    plot_chebyshev,
+    plot_halley,
+    plot_householder,
+    plot_inverse_quadratic,
+    plot_newton,
+    plot_newton_system,
+    plot_secant,
+    plot_simple_iteration,
+    plot_steffensen,
+)
+from system_solver import SystemSolver
+from trace_archive import TraceArchive
+from zero_finder import ZeroFinder
+
+# method -> (trace attribute, LaTeX generator, plot function)
+scalar_methods = {
+    "bisection": ("bisection_data", generate_bisection_latex_table, plot_bisection),
+    "newton": ("newton_data", generate_newton_latex_table, plot_newton),
+    "simple_iteration": (
+        "simple_iter_data",
+        generate_simple_iter_latex_table,
+        plot_simple_iteration,
+    ),
+    "halley": ("halley_data", generate_halley_latex_table, plot_halley),
+    "chebyshev": ("chebyshev_data", generate_chebyshev_latex_table, plot_chebyshev),
+    "householder": (
+        "householder_data",
+        generate_householder_latex_table,
+        plot_householder,
+    ),
+    "secant": ("secant_data", generate_secant_latex_table, plot_secant),
+    "steffensen": ("steffensen_data", generate_steffensen_latex_table, plot_steffensen),
+    "inverse_quadratic": (
+        "inverse_quadratic_data",
+        generate_inverse_quadratic_latex_table,
+        plot_inverse_quadratic,
+    ),
+}
+
+
+def replay_run(archive, run, output_dir, func=None):
+    """
+    Regenerate the LaTeX table and plots of an archived run without solving
+    again. Scalar plots need f to draw the curve: it is taken from the
+    archived expression or from func; without either only LaTeX is written.
+    Returns False for runs of methods that cannot be replayed.
+    """
+    method = run["method"]
+    if method != "newton_system" and method not in scalar_methods:
+        print(f"Run {run['run']}: nothing to replay for method {method}")
+        return False
+    trace = archive.trace(run["run"])
+    os.makedirs(output_dir, exist_ok=True)
+
+    if method == "newton_system":
+        meta = run["meta"]
+        solver = SystemSolver(None, None, meta["initial_guess"], output_dir + os.sep)
+        solver.iterations = trace
+        latex_str = generate_newton_system_latex_table(solver)
+        with open(os.path.join(output_dir, "newton_system.tex"), "w") as file:
+            file.write(latex_str)
+        plot_newton_system(solver)
+        return True
+
+    attribute, generate_latex, plot = scalar_methods[method]
+    meta = run["meta"]
+    func = meta["expression"] or func
+    zero_finder = ZeroFinder(
+        func, None, (meta["a"], meta["b"]), plot_path=output_dir + os.sep
+    )
+    setattr(zero_finder, attribute, trace)
+
+    latex_str = generate_latex(zero_finder)
+    with open(os.path.join(output_dir, f"{method}.tex"), "w") as file:
+        file.write(latex_str)
+    if func is None:
+        print(f"Run {run['run']}: no function stored, skipping plots")
+        return True
+    plot(zero_finder)
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Regenerate LaTeX tables and plots from a trace archive"
+    )
+    parser.add_argument("archive", help="Trace archive directory")
+    parser.add_argument("--run", type=int, nargs="*", help="Run ids (default: all)")
+    parser.add_argument("--output", default="output/replay", help="Output directory")
+    parser.add_argument(
+        "--expression", help="f(x) for runs archived without an expression"
+    )
+    parser.add_argument(
+        "--equation", type=int, help="Take f(x) from main.py equations by ID"
+    )
+    args = parser.parse_args()
+
+    func = args.expression
+    if args.equation is not None:
+        from main import equations
+
+        func = next(eq["f"] for eq in equations if eq["id"] == args.equation)
+
+    archive = TraceArchive(args.archive)
+    for run in archive.runs():
+        if args.run and run["run"] not in args.run:
+            continue
+        output_dir = os.path.join(args.output, f"run_{run['run']}_{run['method']}")
+        if replay_run(archive, run, output_dir, func):
+            print(f"Run {run['run']} ({run['method']}) -> {output_dir}")
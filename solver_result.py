@@ -0,0 +1,145 @@
+import math
+from dataclasses import dataclass
+from typing import Any
+
+# Termination reasons
+CONVERGED = "converged"
+MAX_ITERATIONS = "max_iterations"
+DIVERGED = "diverged"
+OSCILLATING = "oscillating"
+STAGNATED = "stagnated"
+NON_FINITE = "non_finite"
+ZERO_DERIVATIVE = "zero_derivative"
+SINGULAR_JACOBIAN = "singular_jacobian"
+OUT_OF_INTERVAL = "out_of_interval"
+
+# Consecutive suspicious iterations before divergence/oscillation is declared
+DEFAULT_PATIENCE = 5
+# Iterations without a new best residual before stagnation is declared
+DEFAULT_STAGNATION_WINDOW = 20
+
+
+@dataclass
+class SolverResult:
+    """
+    Outcome of a single solver run.
+
+    Attributes:
+    - root: Final iterate (float or numpy array)
+    - residual: |f(root)| or ||F(root)||
+    - iterations: Number of iterations performed
+    - func_evals: Number of function evaluations
+    - derivative_evals: Number of derivative / Jacobian evaluations
+    - reason: Termination reason, one of the constants in this module
+    - elapsed: Wall time in seconds
+    """
+
+    root: Any
+    residual: float
+    iterations: int
+    func_evals: int
+    derivative_evals: int
+    reason: str
+    elapsed: float
+
+    @property
+    def converged(self):
+        return self.reason == CONVERGED
+
+
+class CountingFunction:
+    """
+    Wrap a callable and count how many times it is called.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.calls = 0
+
+    def __call__(self, *args):
+        self.calls += 1
+        return self.func(*args)
+
+
+class ConvergenceMonitor:
+    """
+    Decide when an open iteration x -> x_new should stop.
+
+    Converged when ||x_new - x|| < tolerance + rtol * ||x_new|| and the
+    residual is below ftol. Gives up early when the iterates become NaN/Inf,
+    when both the step and the residual grow for `patience` iterations in a
+    row (divergence), when the iterates keep jumping back to where they were
+    two steps ago (oscillation), or when the residual has not improved for
+    `stagnation_window` iterations.
+    """
+
+    def __init__(
+        self,
+        tolerance,
+        rtol=0.0,
+        ftol=math.inf,
+        norm=abs,
+        patience=DEFAULT_PATIENCE,
+        stagnation_window=DEFAULT_STAGNATION_WINDOW,
+    ):
+        self.tolerance = tolerance
+        self.rtol = rtol
+        self.ftol = ftol
+        self.norm = norm
+        self.patience = patience
+        self.stagnation_window = stagnation_window
+
+        self.x_before = None
+        self.last_step = math.inf
+        self.last_residual = math.inf
+        self.growing = 0
+        self.oscillating = 0
+        self.best_residual = math.inf
+        self.since_best = 0
+
+    def check(self, x, x_new, residual):
+        """
+        Return a termination reason, or None to keep iterating.
+        """
+        step = float(self.norm(x_new - x))
+        residual = float(residual)
+
+        if not (math.isfinite(step) and math.isfinite(residual)):
+            return NON_FINITE
+        if (
+            step < self.tolerance + self.rtol * float(self.norm(x_new))
+            and residual < self.ftol
+        ):
+            return CONVERGED
+
+        if step > self.last_step and residual > self.last_residual:
+            self.growing += 1
+        else:
+            self.growing = 0
+
+        if (
+            self.x_before is not None
+            and float(self.norm(x_new - self.x_before)) < 0.1 * step
+            and step > 0.99 * self.last_step
+        ):
+            self.oscillating += 1
+        else:
+            self.oscillating = 0
+
+        if residual < self.best_residual:
+            self.best_residual = residual
+            self.since_best = 0
+        else:
+            self.since_best += 1
+
+        self.x_before = x
+        self.last_step = step
+        self.last_residual = residual
+
+        if self.growing >= self.patience:
+            return DIVERGED
+        if self.oscillating >= self.patience:
+            return OSCILLATING
+        if self.since_best >= self.stagnation_window:
+            return STAGNATED
+        return None
@@ -95,12 +95,15 @@ if __name__ == "__main__":
 
     try:
         print("\nRunning Newton's method for system of equations:")
-        root = system_solver.newton_method(
+        result = system_solver.newton_method(
             tolerance=epsilon, max_iterations=max_iterations, debug=True
         )
+        if not result.converged:
+            raise RuntimeError(f"No convergence: {result.reason}")
+        root = result.root
         print(f"Root found: {root}")
         print(f"Function value at root=", system_solver.F(root))
-        print(f"iterations=", len(system_solver.iterations))
+        print(f"iterations=", result.iterations)
 
         # Generate LaTeX table
         latex_table = generate_newton_system_latex_table(system_solver)
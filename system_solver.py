@@ -1,46 +1,82 @@
+import time
+
 import numpy as np
 
+from derivatives import NumericalJacobian
+from solver_result import (
+    CONVERGED,
+    MAX_ITERATIONS,
+    SINGULAR_JACOBIAN,
+    ConvergenceMonitor,
+    CountingFunction,
+    SolverResult,
+)
+
 
 class SystemSolver:
-    def __init__(self, F, J, initial_guess, output_dir="output/"):
+    def __init__(self, F, J, initial_guess, output_dir="output/", trace_archive=None):
         """
         Initialize the system solver for Newton's method.
 
         Parameters:
         - F: Function that returns the vector of residuals
-        - J: Function that returns the Jacobian matrix
+        - J: Function that returns the Jacobian matrix, or None to compute it
+          numerically (see NumericalJacobian); its F calls are then counted
+          in func_evals
         - initial_guess: Initial guess for the solution vector
         - output_dir: Directory to save output files
+        - trace_archive: Optional TraceArchive; iterations of debug runs are
+          then streamed to it instead of being kept in memory
         """
-        self.F = F
-        self.J = J
+        self.F = CountingFunction(F)
+        self.J = CountingFunction(J if J is not None else NumericalJacobian(self.F))
         self.initial_guess = np.array(initial_guess, dtype=float)
         self.output_dir = output_dir
+        self.trace_archive = trace_archive
         self.iterations = []
         self.root = None
         self.converged = False
 
-    def newton_method(self, tolerance=1e-6, max_iterations=100, debug=False):
+    def newton_method(
+        self, tolerance=1e-6, max_iterations=100, debug=False, rtol=0.0
+    ):
         """
         Perform Newton-Raphson iterations to solve the system.
 
         Parameters:
-        - tolerance: Convergence threshold
+        - tolerance: Absolute convergence threshold for ||Δx||
         - max_iterations: Maximum number of iterations
         - debug: Whether to record iteration data
+        - rtol: Relative convergence threshold, ||Δx|| < tolerance + rtol * ||x||
 
         Returns:
-        - x: Final solution vector
+        - SolverResult with the final solution vector as root. Divergence,
+          oscillation, stagnation and NaN/Inf iterates stop the iteration early.
         """
+        start = time.perf_counter()
+        self.F.calls = 0
+        self.J.calls = 0
+        self.converged = False
+        if self.trace_archive is not None and debug:
+            self.iterations = self.trace_archive.open_run(
+                "newton_system",
+                output_dir=self.output_dir,
+                initial_guess=self.initial_guess,
+            )
+        monitor = ConvergenceMonitor(tolerance, rtol, norm=np.linalg.norm)
+
         x = self.initial_guess.copy()
+        iterations = 0
         for i in range(max_iterations):
+            iterations = i + 1
             F_val = self.F(x)
             J_val = self.J(x)
 
             try:
                 delta = np.linalg.solve(J_val, -F_val)
             except np.linalg.LinAlgError:
-                raise RuntimeError("Jacobian is singular and cannot be inverted.")
+                reason = SINGULAR_JACOBIAN
+                break
 
             if debug:
                 iteration_data = {
@@ -51,11 +87,13 @@ class SystemSolver:
                 }
                 self.iterations.append(iteration_data)
 
-            x += delta
+            x_new = x + delta
             print("step: ", delta)
 
-            if np.linalg.norm(delta) < tolerance:
-                if debug:
+            reason = monitor.check(x, x_new, np.linalg.norm(F_val))
+            x = x_new
+            if reason is not None:
+                if debug and reason == CONVERGED:
                     iteration_data = {
                         "iteration": i + 1,
                         "x": x.copy(),
@@ -63,9 +101,24 @@ class SystemSolver:
                         "f_norm": np.linalg.norm(F_val),
                     }
                     self.iterations.append(iteration_data)
+                break
+        else:
+            reason = MAX_ITERATIONS
 
-                self.root = x
-                self.converged = True
-                return x
-
-        raise RuntimeError("Maximum number of iterations reached without convergence.")
+        self.root = x
+        self.converged = reason == CONVERGED
+        try:
+            residual = float(np.linalg.norm(self.F(x)))
+        except (OverflowError, ValueError):
+            residual = np.inf
+        if self.trace_archive is not None and debug:
+            self.iterations.close(root=x, residual=residual, reason=reason)
+        return SolverResult(
+            root=x,
+            residual=residual,
+            iterations=iterations,
+            func_evals=self.F.calls,
+            derivative_evals=self.J.calls,
+            reason=reason,
+            elapsed=time.perf_counter() - start,
+        )
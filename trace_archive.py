@@ -0,0 +1,284 @@
+import json
+import numbers
+import os
+
+import numpy as np
+
+# Values per record; wider trace entries span several consecutive records
+RECORD_WIDTH = 8
+# Integer counters kept as int; every other number is stored as a float
+COUNTER_FIELDS = {"iteration", "root_index"}
+RECORD_DTYPE = np.dtype(
+    [("run", "<u4"), ("step", "<u4"), ("values", "<f8", (RECORD_WIDTH,))]
+)
+
+
+def _layout(entry):
+    """
+    Describe how a trace entry flattens into record values:
+    a list of [name, kind, size] with kind in bool/int/float/array.
+
+    Only the counters in COUNTER_FIELDS are typed as int: a value that
+    happens to be integral in the first entry (e.g. an interval end given
+    as 3) must not truncate the later ones.
+    """
+    fields = []
+    for name, value in entry.items():
+        if isinstance(value, (bool, np.bool_)):
+            fields.append([name, "bool", 1])
+        elif name in COUNTER_FIELDS and isinstance(value, numbers.Integral):
+            fields.append([name, "int", 1])
+        elif np.ndim(value) == 0:
+            fields.append([name, "float", 1])
+        else:
+            fields.append([name, "array", len(value)])
+    return fields
+
+
+def _span(fields):
+    """
+    Number of records one entry with this layout occupies.
+    """
+    width = sum(size for _, _, size in fields)
+    return max(1, -(-width // RECORD_WIDTH))
+
+
+def _encode(entry, fields, values):
+    pos = 0
+    for name, kind, size in fields:
+        if kind == "array":
+            values[pos : pos + size] = entry[name]
+        else:
+            values[pos] = entry[name]
+        pos += size
+
+
+def _decode(values, fields):
+    entry = {}
+    pos = 0
+    for name, kind, size in fields:
+        if kind == "array":
+            entry[name] = np.array(values[pos : pos + size])
+        elif kind == "bool":
+            entry[name] = bool(values[pos])
+        elif kind == "int":
+            entry[name] = int(values[pos])
+        else:
+            entry[name] = float(values[pos])
+        pos += size
+    return entry
+
+
+def _jsonable(value):
+    return value.tolist() if hasattr(value, "tolist") else value
+
+
+class RunView:
+    """
+    Read-only, list-like view of one archived run.
+
+    Entries are decoded on access from the memory-mapped records, so the
+    trace can be handed to the LaTeX and plotting helpers without loading
+    the archive into memory.
+    """
+
+    def __init__(self, archive, run_id, start, count, fields, span=1):
+        self.archive = archive
+        self.run_id = run_id
+        self.start = start
+        self.count = count
+        self.fields = fields
+        self.span = span
+
+    def records(self):
+        """
+        Zero-copy structured array of this run's records, span per entry.
+        """
+        end = self.start + self.count * self.span
+        return self.archive.memmap()[self.start : end]
+
+    def _decode_at(self, records, index):
+        entry = records[index * self.span : (index + 1) * self.span]
+        return _decode(entry["values"].ravel(), self.fields)
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        records = self.records()
+        if isinstance(index, slice):
+            return [
+                self._decode_at(records, i) for i in range(*index.indices(self.count))
+            ]
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("trace index out of range")
+        return self._decode_at(records, index)
+
+    def __iter__(self):
+        records = self.records()
+        for i in range(self.count):
+            yield self._decode_at(records, i)
+
+
+class RunWriter(RunView):
+    """
+    Trace of a run in progress. Every appended entry is written to the
+    archive straight away; the run is added to the index on close().
+    """
+
+    def __init__(self, archive, run_id, start, method, meta):
+        super().__init__(archive, run_id, start, 0, None)
+        self.method = method
+        self.meta = meta
+        self.closed = False
+
+    def append(self, entry):
+        self.extend([entry])
+
+    def extend(self, entries):
+        entries = list(entries)
+        if not entries:
+            return
+        if self.fields is None:
+            self.fields = _layout(entries[0])
+            self.span = _span(self.fields)
+
+        values = np.zeros((len(entries), self.span * RECORD_WIDTH))
+        for i, entry in enumerate(entries):
+            _encode(entry, self.fields, values[i])
+        records = np.zeros(len(entries) * self.span, dtype=RECORD_DTYPE)
+        records["run"] = self.run_id
+        records["step"] = np.repeat(
+            np.arange(self.count, self.count + len(entries)), self.span
+        )
+        records["values"] = values.reshape(-1, RECORD_WIDTH)
+        self.archive._append(records)
+        self.count += len(entries)
+
+    def close(self, **summary):
+        """
+        Add the run to the index; summary (e.g. root, reason) is stored with it.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        self.archive._add_to_index(
+            {
+                "run": self.run_id,
+                "method": self.method,
+                "start": self.start,
+                "count": self.count,
+                "fields": self.fields,
+                "span": self.span,
+                "meta": {k: _jsonable(v) for k, v in self.meta.items()},
+                **{k: _jsonable(v) for k, v in summary.items()},
+            }
+        )
+
+
+class TraceArchive:
+    """
+    Append-only archive of solver traces in a directory.
+
+    - records.bin: fixed-width RECORD_DTYPE records, one per iteration, or
+      several consecutive ones when an iteration has more than RECORD_WIDTH
+      values (e.g. a system with many unknowns)
+    - index.jsonl: one JSON line per finished run with its method, record
+      range, field layout, metadata and result summary
+
+    Runs are written one at a time. Readers np.memmap records.bin, so any
+    run's iterations can be accessed without reading the rest of the file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.records_path = os.path.join(path, "records.bin")
+        self.index_path = os.path.join(path, "index.jsonl")
+        os.makedirs(path, exist_ok=True)
+        self._file = None
+        self._writer = None
+        self._map = None
+        self._run_count = None
+
+    def open_run(self, method, **meta):
+        """
+        Start a new run and return its RunWriter. A run that was left open,
+        e.g. by a solver that raised, is closed as aborted first.
+        """
+        if self._writer is not None:
+            self._writer.close(reason="aborted")
+        if self._run_count is None:
+            self._run_count = len(self.runs())
+        run_id = self._run_count
+        self._run_count += 1
+        self._writer = RunWriter(self, run_id, self._record_count(), method, meta)
+        return self._writer
+
+    def runs(self):
+        if not os.path.exists(self.index_path):
+            return []
+        with open(self.index_path) as file:
+            return [json.loads(line) for line in file if line.strip()]
+
+    def run(self, run_id):
+        for run in self.runs():
+            if run["run"] == run_id:
+                return run
+        raise KeyError(f"No run {run_id} in {self.path}")
+
+    def trace(self, run_id):
+        run = self.run(run_id)
+        return RunView(
+            self,
+            run_id,
+            run["start"],
+            run["count"],
+            run["fields"],
+            run.get("span", 1),
+        )
+
+    def memmap(self):
+        """
+        Memory-map all records, remapping only when the file has grown.
+        """
+        count = self._record_count()
+        if self._map is None or len(self._map) != count:
+            if count == 0:
+                self._map = np.zeros(0, dtype=RECORD_DTYPE)
+            else:
+                self._map = np.memmap(
+                    self.records_path, dtype=RECORD_DTYPE, mode="r", shape=(count,)
+                )
+        return self._map
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close(reason="aborted")
+            self._writer = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _record_count(self):
+        if self._file is not None:
+            self._file.flush()
+        if not os.path.exists(self.records_path):
+            return 0
+        return os.path.getsize(self.records_path) // RECORD_DTYPE.itemsize
+
+    def _append(self, records):
+        if self._file is None:
+            self._file = open(self.records_path, "ab")
+        self._file.write(records.tobytes())
+
+    def _add_to_index(self, run):
+        # The records must be on disk before the index line that claims them
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        with open(self.index_path, "a") as file:
+            file.write(json.dumps(run) + "\n")
+        if self._writer is not None and self._writer.run_id == run["run"]:
+            self._writer = None
@@ -1,74 +1,222 @@
+import math
+import time
+from math import comb
+
+from compiled_kernels import get_kernels, make_callable, run_kernel
+from derivatives import NumericalDerivative
+from solver_result import (
+    CONVERGED,
+    MAX_ITERATIONS,
+    NON_FINITE,
+    OUT_OF_INTERVAL,
+    ZERO_DERIVATIVE,
+    ConvergenceMonitor,
+    CountingFunction,
+    SolverResult,
+)
+
+# Evenly spaced restarts of a deflation search that leaves the interval
+DEFLATION_STARTS = 8
+
+
 class ZeroFinder:
-    def __init__(self, func, derivative, interval, plot_path=""):
-        self.func = func
-        self.derivative = derivative
+    def __init__(
+        self,
+        func,
+        derivative,
+        interval,
+        plot_path="",
+        second_derivative=None,
+        backend="python",
+        trace_archive=None,
+    ):
+        """
+        Parameters:
+        - func, derivative: Callables or expression strings in x; without a
+          derivative it is computed numerically (see NumericalDerivative)
+        - interval: (a, b) with a < b
+        - plot_path: Directory prefix for saved plots
+        - second_derivative: Optional f'', required by the Halley, Chebyshev
+          and Householder methods
+        - backend: "python" or "numba"; "numba" JIT-compiles the functions
+          together with the solver loops and silently falls back to Python
+          when compilation is not possible
+        - trace_archive: Optional TraceArchive; traces of debug runs are then
+          streamed to it instead of being kept in memory
+
+        Every method returns a SolverResult. func and the derivatives are
+        wrapped in CountingFunction so that evaluations can be reported;
+        calls made by a numerical derivative are counted in func_evals.
+        """
+        self.func = CountingFunction(make_callable(func))
+        self.derivative = CountingFunction(
+            make_callable(derivative)
+            if derivative is not None
+            else NumericalDerivative(self.func)
+        )
+        self.second_derivative = (
+            CountingFunction(make_callable(second_derivative))
+            if second_derivative is not None
+            else None
+        )
+        self.expression = func if isinstance(func, str) else None
         self.a, self.b = interval
         self.plot_path = plot_path
+        self.trace_archive = trace_archive
+        self._trace = None
         self.bisection_data = []
         self.newton_data = []
         self.simple_iter_data = []
+        self.halley_data = []
+        self.chebyshev_data = []
+        self.householder_data = []
+        self.deflation_data = []
+        self.secant_data = []
+        self.steffensen_data = []
+        self.inverse_quadratic_data = []
 
         if self.a >= self.b:
             raise ValueError("Interval must be in the form [a, b] where a < b")
+        if backend not in ("python", "numba"):
+            raise ValueError(f"Unknown backend: {backend}")
 
-    def bisection_method(self, tolerance=1e-6, max_iterations=1000, debug=False):
-        self.bisection_data = []
+        self.kernels = get_kernels(func, derivative) if backend == "numba" else None
+
+    def bisection_method(
+        self, tolerance=1e-6, max_iterations=1000, debug=False, rtol=0.0
+    ):
+        start = self._start()
         a, b = self.a, self.b
         fa = self.func(a)
         fb = self.func(b)
 
         if fa * fb >= 0:
             raise ValueError("Function must have opposite signs at endpoints")
+        self.bisection_data = self._new_trace("bisection", debug)
+
+        if self.kernels is not None:
+            bisection_kernel = self.kernels[0]
+            result = run_kernel(
+                bisection_kernel,
+                float(a),
+                float(b),
+                tolerance,
+                rtol,
+                max_iterations,
+                debug,
+            )
+            if result is not None:
+                root, reason, iterations, trace = result
+                if debug:
+                    self.bisection_data.extend(
+                        {"left": row[0], "right": row[1], "mid": row[2], "f_mid": row[3]}
+                        for row in trace.tolist()
+                    )
+                if reason == CONVERGED:
+                    print("function value return:", True)
+                    print("function argument return:", True)
+                return self._result(
+                    start,
+                    root,
+                    reason,
+                    iterations,
+                    abs(trace[-1][3]) if reason != MAX_ITERATIONS else None,
+                    func_evals=1 + iterations,
+                )
 
-        for _ in range(max_iterations):
+        for iteration in range(1, max_iterations + 1):
             c = (a + b) / 2
-            fc = self.func(c)
+            try:
+                fc = self.func(c)
+            except (OverflowError, ValueError):
+                return self._result(start, c, NON_FINITE, iteration, math.inf)
 
             if debug:
                 self.bisection_data.append(
                     {"left": a, "right": b, "mid": c, "f_mid": fc}
                 )
 
-            if abs(fc) < tolerance and (b - a) / 2 < tolerance:
+            if not math.isfinite(fc):
+                return self._result(start, c, NON_FINITE, iteration, abs(fc))
+
+            if abs(fc) < tolerance and (b - a) / 2 < tolerance + rtol * abs(c):
                 print("function value return:", abs(fc) < tolerance)
                 print("function argument return:", (b - a) / 2 < tolerance)
 
-                return c
+                return self._result(start, c, CONVERGED, iteration, abs(fc))
 
             if fa * fc < 0:
                 b, fb = c, fc
             else:
                 a, fa = c, fc
 
-        return (a + b) / 2
+        return self._result(start, (a + b) / 2, MAX_ITERATIONS, max_iterations)
 
     def newton_method(
-        self, initial_guess=None, tolerance=1e-6, max_iterations=1000, debug=False
+        self,
+        initial_guess=None,
+        tolerance=1e-6,
+        max_iterations=1000,
+        debug=False,
+        rtol=0.0,
     ):
-        self.newton_data = []
-        x = initial_guess if initial_guess else (self.a + self.b) / 2
+        start = self._start()
+        self.newton_data = self._new_trace("newton", debug)
+        x = initial_guess if initial_guess is not None else (self.a + self.b) / 2
 
-        for _ in range(max_iterations):
-            fx = self.func(x)
-            dfx = self.derivative(x)
+        if self.kernels is not None and self.kernels[1] is not None:
+            newton_kernel = self.kernels[1]
+            result = run_kernel(
+                newton_kernel, float(x), tolerance, rtol, max_iterations, debug
+            )
+            if result is not None:
+                root, reason, iterations, trace = result
+                if debug:
+                    self.newton_data.extend(
+                        {"x": row[0], "fx": row[1], "dfx": row[2], "x_new": row[3]}
+                        for row in trace.tolist()
+                    )
+                return self._result(
+                    start,
+                    root,
+                    reason,
+                    iterations,
+                    func_evals=iterations,
+                    derivative_evals=iterations,
+                )
+
+        monitor = ConvergenceMonitor(tolerance, rtol)
+        for iteration in range(1, max_iterations + 1):
+            try:
+                fx = self.func(x)
+                dfx = self.derivative(x)
+            except (OverflowError, ValueError):
+                return self._result(start, x, NON_FINITE, iteration, math.inf)
             if dfx == 0:
-                raise ValueError("Zero derivative encountered")
+                return self._result(start, x, ZERO_DERIVATIVE, iteration, abs(fx))
             x_new = x - fx / dfx
 
             if debug:
                 self.newton_data.append({"x": x, "fx": fx, "dfx": dfx, "x_new": x_new})
 
-            if abs(x_new - x) < tolerance:
-                return x_new
+            reason = monitor.check(x, x_new, abs(fx))
+            if reason is not None:
+                return self._result(start, x_new, reason, iteration)
             x = x_new
 
-        return x
+        return self._result(start, x, MAX_ITERATIONS, max_iterations)
 
     def simple_iteration_method(
-        self, initial_guess=None, tolerance=1e-6, max_iterations=1000, debug=False
+        self,
+        initial_guess=None,
+        tolerance=1e-6,
+        max_iterations=1000,
+        debug=False,
+        rtol=0.0,
     ):
-        self.simple_iter_data = []
-        x0 = initial_guess if initial_guess else (self.a + self.b) / 2
+        start = self._start()
+        self.simple_iter_data = self._new_trace("simple_iteration", debug)
+        x0 = initial_guess if initial_guess is not None else (self.a + self.b) / 2
 
         # Validate contraction condition
         try:
@@ -95,24 +243,543 @@ class ZeroFinder:
         print("phi'(a)=", phi_prime(self.a))
         print("phi'(b)=", phi_prime(self.b))
 
-        for iter_count in range(max_iterations):
-            x_next = phi(x_prev)
+        if self.kernels is not None:
+            simple_iteration_kernel = self.kernels[2]
+            result = run_kernel(
+                simple_iteration_kernel,
+                float(lam),
+                float(x0),
+                tolerance,
+                rtol,
+                max_iterations,
+                debug,
+            )
+            if result is not None:
+                root, reason, iterations, trace = result
+                if debug:
+                    self.simple_iter_data.extend(
+                        {
+                            "iteration": i + 1,
+                            "x_prev": row[0],
+                            "x_next": row[1],
+                            "f_x_next": row[2],
+                            "error": row[3],
+                        }
+                        for i, row in enumerate(trace.tolist())
+                    )
+                return self._result(
+                    start,
+                    root,
+                    reason,
+                    iterations,
+                    abs(trace[-1][2]),
+                    func_evals=2 * iterations,
+                )
+
+        monitor = ConvergenceMonitor(tolerance, rtol, ftol=tolerance)
+        for iteration in range(1, max_iterations + 1):
+            try:
+                x_next = phi(x_prev)
+                f_x_next = self.func(x_next)
+            except (OverflowError, ValueError):
+                return self._result(start, x_prev, NON_FINITE, iteration, math.inf)
             error = abs(x_next - x_prev)
 
             if debug:
                 self.simple_iter_data.append(
                     {
-                        "iteration": iter_count + 1,
+                        "iteration": iteration,
                         "x_prev": x_prev,
                         "x_next": x_next,
-                        "f_x_next": self.func(x_next),
+                        "f_x_next": f_x_next,
                         "error": error,
                     }
                 )
 
-            if error < tolerance and abs(self.func(x_next)) < tolerance:
-                return x_next
+            reason = monitor.check(x_prev, x_next, abs(f_x_next))
+            if reason is not None:
+                return self._result(start, x_next, reason, iteration, abs(f_x_next))
 
             x_prev = x_next
 
-        raise ValueError(f"No convergence in {max_iterations} iterations")
+        return self._result(start, x_prev, MAX_ITERATIONS, max_iterations)
+
+    def halley_method(
+        self,
+        initial_guess=None,
+        tolerance=1e-6,
+        max_iterations=1000,
+        debug=False,
+        rtol=0.0,
+    ):
+        """
+        Halley's method, cubically convergent:
+        x_{n+1} = x_n - 2 f f' / (2 f'^2 - f f'')
+        """
+        self._require_second_derivative()
+
+        def step(x, fx):
+            dfx = self.derivative(x)
+            d2fx = self.second_derivative(x)
+            denominator = 2 * dfx**2 - fx * d2fx
+            x_new = x - 2 * fx * dfx / denominator if denominator != 0 else None
+            return x_new, dfx, d2fx
+
+        self.halley_data = self._new_trace("halley", debug)
+        return self._safeguarded_iteration(
+            step,
+            self.halley_data,
+            initial_guess,
+            tolerance,
+            rtol,
+            max_iterations,
+            debug,
+        )
+
+    def chebyshev_method(
+        self,
+        initial_guess=None,
+        tolerance=1e-6,
+        max_iterations=1000,
+        debug=False,
+        rtol=0.0,
+    ):
+        """
+        Chebyshev's method, cubically convergent:
+        x_{n+1} = x_n - f / f' * (1 + f f'' / (2 f'^2))
+        """
+        self._require_second_derivative()
+
+        def step(x, fx):
+            dfx = self.derivative(x)
+            d2fx = self.second_derivative(x)
+            if dfx == 0:
+                return None, dfx, d2fx
+            x_new = x - fx / dfx * (1 + fx * d2fx / (2 * dfx**2))
+            return x_new, dfx, d2fx
+
+        self.chebyshev_data = self._new_trace("chebyshev", debug)
+        return self._safeguarded_iteration(
+            step,
+            self.chebyshev_data,
+            initial_guess,
+            tolerance,
+            rtol,
+            max_iterations,
+            debug,
+        )
+
+    def householder_method(
+        self,
+        order=2,
+        higher_derivatives=(),
+        initial_guess=None,
+        tolerance=1e-6,
+        max_iterations=1000,
+        debug=False,
+        rtol=0.0,
+    ):
+        """
+        Householder's method of order d, converging with order d + 1:
+        x_{n+1} = x_n + d (1/f)^(d-1) / (1/f)^(d)
+
+        Order 2 is Halley's method. Higher orders need the third and further
+        derivatives of f, passed in order as higher_derivatives.
+        """
+        if order < 2:
+            raise ValueError("Householder order must be at least 2, use newton_method")
+        self._require_second_derivative()
+        derivatives = [self.derivative, self.second_derivative]
+        derivatives += [CountingFunction(make_callable(d)) for d in higher_derivatives]
+        if len(derivatives) < order:
+            raise ValueError(f"Householder order {order} needs {order} derivatives")
+        derivatives = derivatives[:order]
+
+        def step(x, fx):
+            f_derivs = [fx] + [d(x) for d in derivatives]
+            # Derivatives of g = 1/f from (f g)^(n) = 0
+            g = [1 / fx]
+            for n in range(1, order + 1):
+                s = sum(comb(n, k) * f_derivs[k] * g[n - k] for k in range(1, n + 1))
+                g.append(-g[0] * s)
+            x_new = x + order * g[order - 1] / g[order] if g[order] != 0 else None
+            return x_new, f_derivs[1], f_derivs[2]
+
+        self.householder_data = self._new_trace("householder", debug)
+        result = self._safeguarded_iteration(
+            step,
+            self.householder_data,
+            initial_guess,
+            tolerance,
+            rtol,
+            max_iterations,
+            debug,
+        )
+        result.derivative_evals += sum(d.calls for d in derivatives[2:])
+        return result
+
+    def secant_method(
+        self,
+        initial_guess=None,
+        tolerance=1e-6,
+        max_iterations=1000,
+        debug=False,
+        rtol=0.0,
+    ):
+        """
+        Secant method, order ~1.618 with one evaluation of f per iteration:
+        x_{n+1} = x_n - f(x_n) (x_n - x_{n-1}) / (f(x_n) - f(x_{n-1}))
+
+        initial_guess is a pair (x_0, x_1), by default the interval ends.
+        """
+        start = self._start()
+        self.secant_data = self._new_trace("secant", debug)
+        x_prev, x = initial_guess if initial_guess is not None else (self.a, self.b)
+        f_prev = self.func(x_prev)
+        monitor = ConvergenceMonitor(tolerance, rtol, ftol=tolerance)
+
+        for iteration in range(1, max_iterations + 1):
+            try:
+                fx = self.func(x)
+            except (OverflowError, ValueError):
+                return self._result(start, x, NON_FINITE, iteration, math.inf)
+            if fx == f_prev:
+                return self._result(start, x, ZERO_DERIVATIVE, iteration, abs(fx))
+            x_new = x - fx * (x - x_prev) / (fx - f_prev)
+
+            if debug:
+                self.secant_data.append(
+                    {"x_prev": x_prev, "x": x, "fx": fx, "x_new": x_new}
+                )
+
+            reason = monitor.check(x, x_new, abs(fx))
+            if reason is not None:
+                return self._result(start, x_new, reason, iteration)
+            x_prev, f_prev = x, fx
+            x = x_new
+
+        return self._result(start, x, MAX_ITERATIONS, max_iterations)
+
+    def steffensen_method(
+        self,
+        initial_guess=None,
+        tolerance=1e-6,
+        max_iterations=1000,
+        debug=False,
+        rtol=0.0,
+    ):
+        """
+        Steffensen's method, quadratically convergent without derivatives at
+        two evaluations of f per iteration:
+        x_{n+1} = x_n - f(x_n) / g(x_n), g(x) = (f(x + f(x)) - f(x)) / f(x)
+
+        Needs a starting point close to the root, since x + f(x) must stay
+        near it as well.
+        """
+        start = self._start()
+        self.steffensen_data = self._new_trace("steffensen", debug)
+        x = initial_guess if initial_guess is not None else (self.a + self.b) / 2
+        monitor = ConvergenceMonitor(tolerance, rtol, ftol=tolerance)
+
+        for iteration in range(1, max_iterations + 1):
+            try:
+                fx = self.func(x)
+                if fx == 0:
+                    return self._result(start, x, CONVERGED, iteration, 0.0)
+                slope = (self.func(x + fx) - fx) / fx
+            except (OverflowError, ValueError):
+                return self._result(start, x, NON_FINITE, iteration, math.inf)
+            if slope == 0:
+                return self._result(start, x, ZERO_DERIVATIVE, iteration, abs(fx))
+            x_new = x - fx / slope
+
+            if debug:
+                self.steffensen_data.append(
+                    {"x": x, "fx": fx, "slope": slope, "x_new": x_new}
+                )
+
+            reason = monitor.check(x, x_new, abs(fx))
+            if reason is not None:
+                return self._result(start, x_new, reason, iteration)
+            x = x_new
+
+        return self._result(start, x, MAX_ITERATIONS, max_iterations)
+
+    def inverse_quadratic_method(
+        self,
+        initial_guess=None,
+        tolerance=1e-6,
+        max_iterations=1000,
+        debug=False,
+        rtol=0.0,
+    ):
+        """
+        Inverse quadratic interpolation, order ~1.839 with one evaluation of
+        f per iteration: x is interpolated as a quadratic in f through the
+        last three points and evaluated at f = 0. A secant step is taken
+        when two of the three f values coincide.
+
+        initial_guess is a triple (x_0, x_1, x_2), by default a, (a + b) / 2, b.
+        """
+        start = self._start()
+        self.inverse_quadratic_data = self._new_trace("inverse_quadratic", debug)
+        if initial_guess is not None:
+            x0, x1, x2 = initial_guess
+        else:
+            x0, x1, x2 = self.a, (self.a + self.b) / 2, self.b
+        f0 = self.func(x0)
+        f1 = self.func(x1)
+        monitor = ConvergenceMonitor(tolerance, rtol, ftol=tolerance)
+
+        for iteration in range(1, max_iterations + 1):
+            try:
+                f2 = self.func(x2)
+            except (OverflowError, ValueError):
+                return self._result(start, x2, NON_FINITE, iteration, math.inf)
+            if f2 == 0:
+                return self._result(start, x2, CONVERGED, iteration, 0.0)
+
+            if f0 != f1 and f0 != f2 and f1 != f2:
+                x_new = (
+                    x0 * f1 * f2 / ((f0 - f1) * (f0 - f2))
+                    + x1 * f0 * f2 / ((f1 - f0) * (f1 - f2))
+                    + x2 * f0 * f1 / ((f2 - f0) * (f2 - f1))
+                )
+            elif f1 != f2:
+                x_new = x2 - f2 * (x2 - x1) / (f2 - f1)
+            else:
+                return self._result(start, x2, ZERO_DERIVATIVE, iteration, abs(f2))
+
+            if debug:
+                self.inverse_quadratic_data.append(
+                    {"x": x2, "fx": f2, "x_new": x_new}
+                )
+
+            reason = monitor.check(x2, x_new, abs(f2))
+            if reason is not None:
+                return self._result(start, x_new, reason, iteration)
+            x0, f0, x1, f1, x2 = x1, f1, x2, f2, x_new
+
+        return self._result(start, x2, MAX_ITERATIONS, max_iterations)
+
+    def deflation_method(
+        self,
+        n_roots=None,
+        initial_guess=None,
+        tolerance=1e-6,
+        max_iterations=1000,
+        debug=False,
+        rtol=0.0,
+    ):
+        """
+        Find several roots with Newton's method on the deflated function
+        f(x) / prod(x - r_i), where r_i are the roots found so far:
+        x_{n+1} = x_n - f / (f' - f * sum 1 / (x_n - r_i))
+
+        Each search starts from initial_guess (by default the middle of the
+        interval) and the deflation term pushes it away from known roots.
+        Searches are stopped when an iterate leaves [a, b], so only roots in
+        the interval are found; a failed search is retried from the next of
+        DEFLATION_STARTS + 1 evenly spaced points of [a, b]. Searching stops
+        after n_roots roots, when no starting point yields a new root (the
+        interval is exhausted) or when f cannot be evaluated. The result's
+        root is the sorted list of roots found so far in every case.
+
+        The result is converged when n_roots roots were found or, without
+        n_roots, when the interval is exhausted after at least one root.
+        Otherwise the reason is that of the last failed search.
+        """
+        start = self._start()
+        self.deflation_data = self._new_trace("deflation", debug)
+        x0 = initial_guess if initial_guess is not None else (self.a + self.b) / 2
+        step = (self.b - self.a) / DEFLATION_STARTS
+        starts = [x0] + [self.a + k * step for k in range(DEFLATION_STARTS + 1)]
+        roots = []
+        iterations = 0
+
+        while n_roots is None or len(roots) < n_roots:
+            for x in starts:
+                if any(abs(x - r) < tolerance for r in roots):
+                    continue
+                root, reason, search_iterations = self._deflated_search(
+                    x, roots, tolerance, rtol, max_iterations, debug
+                )
+                iterations += search_iterations
+                if reason in (CONVERGED, NON_FINITE):
+                    break
+            if reason != CONVERGED:
+                break
+            roots.append(root)
+
+        if n_roots is not None and len(roots) == n_roots:
+            reason = CONVERGED
+        elif n_roots is None and roots and reason != NON_FINITE:
+            reason = CONVERGED
+        residual = max((abs(self.func(r)) for r in roots), default=math.inf)
+        return self._result(start, sorted(roots), reason, iterations, residual)
+
+    def _deflated_search(self, x, roots, tolerance, rtol, max_iterations, debug):
+        """
+        One Newton search on f deflated by the known roots, stopped when an
+        iterate leaves [a, b]. Returns (x, reason, iterations).
+        """
+        monitor = ConvergenceMonitor(tolerance, rtol)
+        for iteration in range(1, max_iterations + 1):
+            try:
+                fx = self.func(x)
+                dfx = self.derivative(x)
+            except (OverflowError, ValueError):
+                return x, NON_FINITE, iteration
+            correction = sum(1 / (x - r) for r in roots)
+            denominator = dfx - fx * correction
+            if denominator == 0:
+                return x, ZERO_DERIVATIVE, iteration
+            x_new = x - fx / denominator
+
+            if debug:
+                self.deflation_data.append(
+                    {
+                        "root_index": len(roots) + 1,
+                        "x": x,
+                        "fx": fx,
+                        "dfx": dfx,
+                        "x_new": x_new,
+                    }
+                )
+
+            deflated = fx / math.prod(x - r for r in roots)
+            reason = monitor.check(x, x_new, abs(deflated))
+            if reason in (None, CONVERGED) and not self.a <= x_new <= self.b:
+                reason = OUT_OF_INTERVAL
+            if reason is not None:
+                return x_new, reason, iteration
+            x = x_new
+
+        return x, MAX_ITERATIONS, max_iterations
+
+    def _require_second_derivative(self):
+        if self.second_derivative is None:
+            raise ValueError("Second derivative is required for this method")
+
+    def _new_trace(self, method, debug):
+        """
+        Return an empty trace for a run: a list, or a run streamed to the
+        trace archive when one is set and debug is on. A run left open by a
+        method that raised is closed as aborted.
+        """
+        if self._trace is not None:
+            self._trace.close(reason="aborted")
+            self._trace = None
+        if self.trace_archive is None or not debug:
+            return []
+        self._trace = self.trace_archive.open_run(
+            method,
+            a=self.a,
+            b=self.b,
+            plot_path=self.plot_path,
+            expression=self.expression,
+        )
+        return self._trace
+
+    def _start(self):
+        """
+        Reset the evaluation counters and return the start time of a run.
+        """
+        for f in (self.func, self.derivative, self.second_derivative):
+            if f is not None:
+                f.calls = 0
+        return time.perf_counter()
+
+    def _result(
+        self,
+        start,
+        root,
+        reason,
+        iterations,
+        residual=None,
+        func_evals=0,
+        derivative_evals=0,
+    ):
+        """
+        Build a SolverResult; func_evals and derivative_evals are added to
+        the counted calls for work done by a compiled kernel.
+        """
+        if residual is None:
+            try:
+                residual = abs(self.func(root))
+            except (OverflowError, ValueError):
+                residual = math.inf
+        derivative_evals += sum(
+            f.calls for f in (self.derivative, self.second_derivative) if f is not None
+        )
+        result = SolverResult(
+            root=root,
+            residual=residual,
+            iterations=iterations,
+            func_evals=self.func.calls + func_evals,
+            derivative_evals=derivative_evals,
+            reason=reason,
+            elapsed=time.perf_counter() - start,
+        )
+        if self._trace is not None:
+            self._trace.close(root=root, residual=residual, reason=reason)
+            self._trace = None
+        return result
+
+    def _safeguarded_iteration(
+        self, step, data, initial_guess, tolerance, rtol, max_iterations, debug
+    ):
+        """
+        Run x_{n+1} = step(x_n) keeping a sign-change bracket inside [a, b].
+
+        Whenever the step is undefined or leaves the current bracket, a
+        bisection step is taken instead. If f does not change sign on [a, b]
+        the iteration runs unguarded.
+        """
+        start = self._start()
+        x = initial_guess if initial_guess is not None else (self.a + self.b) / 2
+        a, b = self.a, self.b
+        fa = self.func(a)
+        bracketed = fa * self.func(b) < 0
+        monitor = ConvergenceMonitor(tolerance, rtol)
+
+        for iteration in range(1, max_iterations + 1):
+            try:
+                fx = self.func(x)
+                if fx == 0:
+                    return self._result(start, x, CONVERGED, iteration, 0.0)
+
+                if bracketed and a < x < b:
+                    if fa * fx < 0:
+                        b = x
+                    else:
+                        a, fa = x, fx
+
+                x_new, dfx, d2fx = step(x, fx)
+            except (OverflowError, ValueError):
+                return self._result(start, x, NON_FINITE, iteration, math.inf)
+            bisected = False
+            if x_new is None and not bracketed:
+                return self._result(start, x, ZERO_DERIVATIVE, iteration, abs(fx))
+            if bracketed and not (x_new is not None and a <= x_new <= b):
+                x_new = (a + b) / 2
+                bisected = True
+
+            if debug:
+                data.append(
+                    {
+                        "x": x,
+                        "fx": fx,
+                        "dfx": dfx,
+                        "d2fx": d2fx,
+                        "x_new": x_new,
+                        "bisected": bisected,
+                    }
+                )
+
+            reason = monitor.check(x, x_new, abs(fx))
+            if reason is not None:
+                return self._result(start, x_new, reason, iteration)
+            x = x_new
+
+        return self._result(start, x, MAX_ITERATIONS, max_iterations)